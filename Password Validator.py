@@ -14,9 +14,100 @@ Author: Password Security Tool
 Version: 1.0
 """
 
-import re
+import functools
+import os
+import string
 import sys
-from typing import Tuple
+from typing import Iterable, List, Tuple
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    # Batch validation falls back to pure Python without NumPy and Numba
+    np = None
+    njit = None
+
+
+# Special characters accepted by the default password policy
+_SPECIAL_DEFAULT = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+
+try:
+    from _pwsimd import SPECIAL_DEFAULT as _SIMD_SPECIAL_DEFAULT
+    from _pwsimd import classify16 as _simd_classify16
+except ImportError:
+    # The SIMD accelerator is optional; 16-byte passwords use the other paths
+    _simd_classify16 = None
+else:
+    # Only use an extension built for the same default special characters
+    if _SIMD_SPECIAL_DEFAULT != _SPECIAL_DEFAULT.encode("ascii"):
+        _simd_classify16 = None
+
+try:
+    from _pwvalidator import SPECIAL_DEFAULT as _C_SPECIAL_DEFAULT
+    from _pwvalidator import classify as _c_classify
+except ImportError:
+    # The Cython accelerator is optional; classify in Python when not built
+    _c_classify = None
+else:
+    # Only use an extension built for the same default special characters
+    if _C_SPECIAL_DEFAULT != _SPECIAL_DEFAULT.encode("ascii"):
+        _c_classify = None
+
+# Longest required length for which an unrolled classifier is generated
+_UNROLL_LIMIT = 64
+
+
+@functools.lru_cache(maxsize=32)
+def _class_table_for(special_characters: str) -> bytes:
+    """
+    Build the character class lookup table for a set of special characters.
+    
+    The table maps every byte value to its character class bits (1 =
+    uppercase, 2 = lowercase, 4 = number, 8 = special). Only ASCII bytes are
+    classified: passwords are UTF-8 encoded, so non-ASCII characters never
+    match a class.
+    
+    Args:
+        special_characters (str): Characters accepted as special characters
+        
+    Returns:
+        bytes: 256-entry lookup table, also usable with bytes.translate
+    """
+    return bytes(
+        ((1 if "A" <= chr(i) <= "Z" else 0)
+         | (2 if "a" <= chr(i) <= "z" else 0)
+         | (4 if "0" <= chr(i) <= "9" else 0)
+         | (8 if chr(i) in special_characters else 0))
+        if i < 128 else 0
+        for i in range(256)
+    )
+
+
+# Class table for the default policy, built once at import
+_CLASS_TBL = _class_table_for(_SPECIAL_DEFAULT)
+
+
+if njit is not None:
+    @njit("b1[:](u1[:, ::1], u1[::1])", cache=True)
+    def _validate_kernel(passwords, class_table):
+        """
+        Check a batch of fixed-length encoded passwords in native code.
+        
+        Args:
+            passwords: 2-D uint8 array with one encoded password per row
+            class_table: 256-entry uint8 character class lookup table
+            
+        Returns:
+            Boolean array, True where a row contains every character class
+        """
+        result = np.empty(passwords.shape[0], dtype=np.bool_)
+        for row in range(passwords.shape[0]):
+            acc = 0
+            for col in range(passwords.shape[1]):
+                acc |= class_table[passwords[row, col]]
+            result[row] = (acc & 0xF) == 0xF
+        return result
 
 
 class PasswordValidator:
@@ -27,24 +118,172 @@ class PasswordValidator:
     methods to check various password requirements.
     """
     
-    def __init__(self):
+    # Shared failure tuple returned for every valid password
+    _EMPTY: Tuple[str, ...] = ()
+    
+    def __init__(self, required_length: int = 16,
+                 special_characters: str = _SPECIAL_DEFAULT):
         """
-        Initialize the PasswordValidator with predefined security requirements.
+        Initialize the PasswordValidator with the given security requirements.
         
         Sets up the required password length and defines what constitutes
         valid special characters for the password policy.
+        
+        Args:
+            required_length (int): Exact password length required (default 16)
+            special_characters (str): Characters accepted as special characters
+            
+        Raises:
+            ValueError: If a special character is also a letter or number
         """
-        # Define the required password length (16 characters)
-        self.required_length = 16
+        # Each character may belong to only one class in the lookup table
+        if any(c.isalnum() and ord(c) < 128 for c in special_characters):
+            raise ValueError("Special characters must not include letters or numbers")
+        
+        # Define the required password length (16 characters by default).
+        # The policy is read-only once built, since the lookup tables and
+        # failure messages below are derived from it
+        self._required_length = required_length
         
         # Define acceptable special characters for password validation
-        self.special_characters = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+        self._special_characters = special_characters
+        
+        # Failure messages, with the character class bit each one reports
+        self._length_message = f"Password must be exactly {self._required_length} characters long"
+        self._length_failure = (self._length_message,)
+        self._failure_messages = (
+            (1, "Password must contain at least one uppercase letter (A-Z)"),
+            (2, "Password must contain at least one lowercase letter (a-z)"),
+            (4, "Password must contain at least one number (0-9)"),
+            (8, f"Password must contain at least one special character ({self._special_characters})"),
+        )
+        
+        # Character class lookup table: the default policy shares the table
+        # built at import, custom special characters get a memoized one
+        if self._special_characters == _SPECIAL_DEFAULT:
+            self._class_table = _CLASS_TBL
+        else:
+            self._class_table = _class_table_for(self._special_characters)
+        
+        # Writable NumPy copy of the table for the batch validation kernel
+        if np is not None:
+            self._class_array = np.frombuffer(bytearray(self._class_table), dtype=np.uint8)
+        
+        # The compiled extensions only know the default special characters
+        self._simd_classify = None
+        self._native_classify = None
+        if self._special_characters == _SPECIAL_DEFAULT:
+            self._simd_classify = _simd_classify16
+            self._native_classify = _c_classify
+        
+        # Generate a classifier unrolled to exactly required_length bytes so
+        # the common case runs as straight-line lookups with no loop. The
+        # length it was generated for is kept alongside it, since it only
+        # accepts input of exactly that many bytes
+        self._fast_classify = None
+        self._unrolled_length = self._required_length
+        if 0 < self._unrolled_length <= _UNROLL_LIMIT:
+            lookups = " | ".join(f"tbl[b[{i}]]" for i in range(self._unrolled_length))
+            namespace = {}
+            exec(f"def _fast_classify(b, tbl=tbl):\n    return {lookups}\n",
+                 {"tbl": self._class_table}, namespace)
+            self._fast_classify = namespace["_fast_classify"]
+        
+        # Character sets for the single-requirement checks; isdisjoint walks
+        # the password in C and stops at the first matching character
+        self._upper_set = frozenset(string.ascii_uppercase)
+        self._lower_set = frozenset(string.ascii_lowercase)
+        self._digit_set = frozenset(string.digits)
+        self._special_set = frozenset(self._special_characters)
         
-        # Create regex patterns for each requirement type
-        self.uppercase_pattern = re.compile(r'[A-Z]')      # Pattern to match uppercase letters
-        self.lowercase_pattern = re.compile(r'[a-z]')      # Pattern to match lowercase letters
-        self.number_pattern = re.compile(r'[0-9]')         # Pattern to match numbers
-        self.special_pattern = re.compile(f'[{re.escape(self.special_characters)}]')  # Pattern for special chars
+        # Non-ASCII special characters cannot be expressed in the byte table,
+        # so such policies also check non-ASCII characters against this set
+        self._wide_specials = None
+        self._special_bytes = None
+        if any(ord(c) > 127 for c in self._special_characters):
+            self._wide_specials = frozenset(c for c in self._special_characters if ord(c) > 127)
+        else:
+            # ASCII special characters as bytes, for deletion with translate
+            self._special_bytes = self._special_characters.encode("ascii")
+    
+    @property
+    def required_length(self) -> int:
+        """
+        Exact password length required by this validator's policy.
+        
+        Returns:
+            int: The required password length
+        """
+        return self._required_length
+    
+    @property
+    def special_characters(self) -> str:
+        """
+        Characters accepted as special characters by this validator's policy.
+        
+        Returns:
+            str: The accepted special characters
+        """
+        return self._special_characters
+    
+    def _classify(self, password: str) -> int:
+        """
+        Compute the character classes present in the password in a single pass.
+        
+        Args:
+            password (str): The password string to classify
+            
+        Returns:
+            int: Bitmask of the character classes found in the password
+        """
+        # ASCII passwords cannot contain non-ASCII special characters, so the
+        # byte table classifies them exactly even for such policies
+        if self._wide_specials is not None and not password.isascii():
+            # One pass over the characters: ASCII ones are looked up in the
+            # class table, anything else can only be a special character.
+            # Stop as soon as every class has been seen
+            classes = 0
+            tbl = self._class_table
+            wide_specials = self._wide_specials
+            for c in password:
+                o = ord(c)
+                if o < 128:
+                    classes |= tbl[o]
+                elif c in wide_specials:
+                    classes |= 8
+                if classes == 0xF:
+                    break
+            return classes
+        
+        return self._classify_encoded(password.encode("utf-8", "surrogatepass"))
+    
+    def _classify_encoded(self, encoded: bytes) -> int:
+        """
+        Compute the character classes present in an already encoded password.
+        
+        Exact for every policy when the password is ASCII; otherwise only for
+        policies whose special characters are all ASCII.
+        
+        Args:
+            encoded (bytes): The UTF-8 encoded password to classify
+            
+        Returns:
+            int: Bitmask of the character classes found in the password
+        """
+        if self._simd_classify is not None and len(encoded) == 16:
+            return self._simd_classify(encoded)
+        if self._native_classify is not None:
+            return self._native_classify(encoded)
+        if self._fast_classify is not None and len(encoded) == self._unrolled_length:
+            return self._fast_classify(encoded)
+        
+        # Translate every byte to its class bits in one C-level pass, then
+        # test for each class with a memchr-speed membership check
+        translated = encoded.translate(self._class_table)
+        return ((1 if 1 in translated else 0)
+                | (2 if 2 in translated else 0)
+                | (4 if 4 in translated else 0)
+                | (8 if 8 in translated else 0))
     
     def check_length(self, password: str) -> bool:
         """
@@ -54,9 +293,9 @@ class PasswordValidator:
             password (str): The password string to validate
             
         Returns:
-            bool: True if password is exactly 16 characters, False otherwise
+            bool: True if password is exactly required_length characters, False otherwise
         """
-        return len(password) == self.required_length
+        return len(password) == self._required_length
     
     def check_uppercase(self, password: str) -> bool:
         """
@@ -68,7 +307,7 @@ class PasswordValidator:
         Returns:
             bool: True if password contains uppercase letter, False otherwise
         """
-        return bool(self.uppercase_pattern.search(password))
+        return not self._upper_set.isdisjoint(password)
     
     def check_lowercase(self, password: str) -> bool:
         """
@@ -80,7 +319,7 @@ class PasswordValidator:
         Returns:
             bool: True if password contains lowercase letter, False otherwise
         """
-        return bool(self.lowercase_pattern.search(password))
+        return not self._lower_set.isdisjoint(password)
     
     def check_numbers(self, password: str) -> bool:
         """
@@ -92,7 +331,7 @@ class PasswordValidator:
         Returns:
             bool: True if password contains a number, False otherwise
         """
-        return bool(self.number_pattern.search(password))
+        return not self._digit_set.isdisjoint(password)
     
     def check_special_characters(self, password: str) -> bool:
         """
@@ -104,44 +343,98 @@ class PasswordValidator:
         Returns:
             bool: True if password contains special character, False otherwise
         """
-        return bool(self.special_pattern.search(password))
+        if self._special_bytes is None:
+            return not self._special_set.isdisjoint(password)
+        
+        # Deleting the special characters in one C loop shortens the
+        # password only if it contained at least one of them
+        encoded = password.encode("utf-8", "surrogatepass")
+        return len(encoded.translate(None, self._special_bytes)) != len(encoded)
     
-    def validate_password(self, password: str) -> Tuple[bool, list]:
+    def validate_password(self, password: str, verbose: bool = False) -> Tuple[bool, Tuple[str, ...]]:
         """
         Perform comprehensive password validation against all requirements.
         
         This method checks the password against all defined security requirements
-        and returns both a boolean result and a list of specific failures.
+        and returns both a boolean result and a tuple of specific failures.
+        
+        A password of the wrong length is rejected immediately with only the
+        length failure reported, unless verbose is set, in which case every
+        requirement is still checked and reported.
         
         Args:
             password (str): The password string to validate
+            verbose (bool): Report all failures even when the length is wrong
             
         Returns:
-            Tuple[bool, list]: A tuple containing:
+            Tuple[bool, Tuple[str, ...]]: A tuple containing:
                 - bool: True if password meets all requirements, False otherwise
-                - list: List of specific requirement failures (empty if all pass)
+                - tuple: Specific requirement failures (empty if all pass)
         """
-        # Initialize list to store any validation failures
-        failures = []
+        # Reject wrong-length passwords before classifying any characters
+        length_ok = self.check_length(password)
+        if not length_ok and not verbose:
+            return False, self._length_failure
         
-        # Check each requirement and add failures to the list
-        if not self.check_length(password):
-            failures.append(f"Password must be exactly {self.required_length} characters long")
-            
-        if not self.check_uppercase(password):
-            failures.append("Password must contain at least one uppercase letter (A-Z)")
-            
-        if not self.check_lowercase(password):
-            failures.append("Password must contain at least one lowercase letter (a-z)")
-            
-        if not self.check_numbers(password):
-            failures.append("Password must contain at least one number (0-9)")
+        # Classify every character once instead of scanning per requirement
+        classes = self._classify(password)
+        
+        # Only build the failure tuple when a requirement actually failed
+        if length_ok and classes == 0xF:
+            return True, self._EMPTY
+        
+        failures = tuple(message for bit, message in self._failure_messages if not classes & bit)
+        if not length_ok:
+            failures = self._length_failure + failures
+        return False, failures
+    
+    def validate_many(self, passwords: Iterable[str]) -> List[bool]:
+        """
+        Check a batch of passwords, returning only whether each one is valid.
+        
+        When NumPy and Numba are installed, every ASCII password of the
+        required length is packed into one uint8 array and classified by a
+        compiled kernel; otherwise each encoded password is classified in
+        Python. The result is a list either way.
+        
+        Args:
+            passwords (Iterable[str]): The password strings to validate
             
-        if not self.check_special_characters(password):
-            failures.append(f"Password must contain at least one special character ({self.special_characters})")
+        Returns:
+            list: One boolean per password, True if valid
+        """
+        passwords = list(passwords)
+        if self._wide_specials is not None:
+            return [self.validate_password(password)[0] for password in passwords]
         
-        # Return True if no failures, False otherwise, along with the failure list
-        return len(failures) == 0, failures
+        # Only passwords of the required length can be valid. Encode each of
+        # them once: ASCII ones encode to exactly required_length bytes and
+        # are collected as rows, non-ASCII ones are classified right away
+        result = [False] * len(passwords)
+        rows = []
+        packed = []
+        for index, password in enumerate(passwords):
+            if len(password) != self._required_length:
+                continue
+            encoded = password.encode("utf-8", "surrogatepass")
+            if len(encoded) == self._required_length:
+                rows.append(index)
+                packed.append(encoded)
+            else:
+                result[index] = self._classify_encoded(encoded) == 0xF
+        
+        if njit is None:
+            for index, encoded in zip(rows, packed):
+                result[index] = self._classify_encoded(encoded) == 0xF
+            return result
+        
+        # Only the exact-length rows go through the compiled kernel
+        if rows:
+            batch = np.frombuffer(bytearray(b"".join(packed)), dtype=np.uint8)
+            batch = batch.reshape(len(rows), self._required_length)
+            for index, is_valid in zip(rows, _validate_kernel(batch, self._class_array).tolist()):
+                result[index] = is_valid
+        return result
     
     def get_password_requirements(self) -> str:
         """
@@ -153,16 +446,145 @@ class PasswordValidator:
         requirements = f"""
 Password Requirements:
 ━━━━━━━━━━━━━━━━━━━━━━
-• Must be exactly {self.required_length} characters long
+• Must be exactly {self._required_length} characters long
 • Must contain at least one uppercase letter (A-Z)
 • Must contain at least one lowercase letter (a-z)  
 • Must contain at least one number (0-9)
-• Must contain at least one special character: {self.special_characters}
+• Must contain at least one special character: {self._special_characters}
 ━━━━━━━━━━━━━━━━━━━━━━
         """
         return requirements.strip()
 
 
+@functools.lru_cache(maxsize=32)
+def _get_validator(required_length: int, special_characters: str) -> PasswordValidator:
+    """
+    Build the PasswordValidator for a policy, memoized per policy.
+    
+    Always called with positional arguments so that each policy maps to
+    exactly one cache entry.
+    
+    Args:
+        required_length (int): Exact password length required
+        special_characters (str): Characters accepted as special characters
+        
+    Returns:
+        PasswordValidator: The cached validator for this policy
+    """
+    return PasswordValidator(required_length, special_characters)
+
+
+def get_validator(required_length: int = 16,
+                  special_characters: str = _SPECIAL_DEFAULT) -> PasswordValidator:
+    """
+    Return a shared PasswordValidator for the given policy.
+    
+    Validators are cached per policy so callers that validate per request
+    do not rebuild the character class tables every time.
+    
+    Args:
+        required_length (int): Exact password length required
+        special_characters (str): Characters accepted as special characters
+        
+    Returns:
+        PasswordValidator: The cached validator for this policy
+    """
+    return _get_validator(required_length, special_characters)
+
+
+# Shared validator for the default password policy
+_DEFAULT = get_validator()
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_validate(password: str, verbose: bool) -> Tuple[bool, Tuple[str, ...]]:
+    """
+    Validate a password against the default policy, memoizing the result.
+    
+    Args:
+        password (str): The password string to validate
+        verbose (bool): Report all failures even when the length is wrong
+        
+    Returns:
+        Tuple[bool, Tuple[str, ...]]: Validation result and failures, as
+        returned by PasswordValidator.validate_password
+    """
+    return _DEFAULT.validate_password(password, verbose)
+
+
+def clear_validation_cache():
+    """
+    Drop every result, and so every password, held by the validation cache.
+    
+    Only needed by callers that pass enable_cache=True to validate_password.
+    """
+    _cached_validate.cache_clear()
+
+
+def validate_password(password: str, verbose: bool = False,
+                      enable_cache: bool = False) -> Tuple[bool, Tuple[str, ...]]:
+    """
+    Validate a password against the default password policy.
+    
+    With enable_cache set, results are memoized for up to 1024 recently seen
+    passwords. The cache keeps those passwords in memory, so only enable it
+    where the passwords are not secret, such as password policy unit tests,
+    and call clear_validation_cache() to drop them.
+    
+    Args:
+        password (str): The password string to validate
+        verbose (bool): Report all failures even when the length is wrong
+        enable_cache (bool): Memoize results for repeated passwords
+        
+    Returns:
+        Tuple[bool, Tuple[str, ...]]: Validation result and failures, as
+        returned by PasswordValidator.validate_password
+    """
+    if enable_cache:
+        return _cached_validate(password, verbose)
+    return _DEFAULT.validate_password(password, verbose)
+
+
+def _output_suppressed() -> bool:
+    """
+    Check whether all application output should be suppressed.
+    
+    Output is suppressed entirely when QUIET=1 is set in the environment
+    and stdout is not a terminal, e.g. under benchmarking harnesses.
+    
+    Returns:
+        bool: True if nothing should be written to stdout
+    """
+    return os.environ.get("QUIET") == "1" and not sys.stdout.isatty()
+
+
+def _write_lines(lines: list):
+    """
+    Write a block of output lines to stdout with a single write call.
+    
+    Nothing is written when output is suppressed.
+    
+    Args:
+        lines (list): The lines to write, without trailing newlines
+    """
+    if _output_suppressed():
+        return
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _prompt(message: str) -> str:
+    """
+    Read a line of input, showing the prompt unless output is suppressed.
+    
+    Args:
+        message (str): The prompt to display
+        
+    Returns:
+        str: The line entered by the user, without surrounding whitespace
+    """
+    return input("" if _output_suppressed() else message).strip()
+
+
 def display_welcome_message():
     """
     Display a welcome message and application information to the user.
@@ -170,13 +592,15 @@ def display_welcome_message():
     This function provides an introduction to the password validator application
     and explains what the user can expect from the tool.
     """
-    print("=" * 60)
-    print("           PASSWORD VALIDATOR APPLICATION")
-    print("=" * 60)
-    print("Welcome to the Password Security Validator!")
-    print("This application will help you create secure passwords")
-    print("that meet enterprise security standards.")
-    print("=" * 60)
+    _write_lines([
+        "=" * 60,
+        "           PASSWORD VALIDATOR APPLICATION",
+        "=" * 60,
+        "Welcome to the Password Security Validator!",
+        "This application will help you create secure passwords",
+        "that meet enterprise security standards.",
+        "=" * 60,
+    ])
 
 
 def get_user_input() -> str:
@@ -191,43 +615,41 @@ def get_user_input() -> str:
     """
     try:
         # Prompt user for password input
-        password = input("\nPlease enter your password: ").strip()
+        password = _prompt("\nPlease enter your password: ")
         return password
     except KeyboardInterrupt:
         # Handle Ctrl+C gracefully
-        print("\n\nOperation cancelled by user.")
+        _write_lines(["\n\nOperation cancelled by user."])
         sys.exit(0)
     except EOFError:
         # Handle EOF errors
-        print("\n\nInput error occurred.")
+        _write_lines(["\n\nInput error occurred."])
         sys.exit(1)
 
 
-def display_validation_result(is_valid: bool, failures: list):
+def display_validation_result(is_valid: bool, failures: Tuple[str, ...]):
     """
     Display the password validation results to the user.
     
     Args:
         is_valid (bool): Whether the password passed validation
-        failures (list): List of specific validation failures
+        failures (tuple): Specific validation failures
     """
-    print("\n" + "=" * 50)
-    print("           VALIDATION RESULTS")
-    print("=" * 50)
+    lines = ["", "=" * 50, "           VALIDATION RESULTS", "=" * 50]
     
     if is_valid:
         # Display success message for valid passwords
-        print("✅ SUCCESS: Password meets all security requirements!")
-        print("Your password is strong and secure.")
+        lines.append("✅ SUCCESS: Password meets all security requirements!")
+        lines.append("Your password is strong and secure.")
     else:
         # Display error message and specific failures for invalid passwords
-        print("❌ ERROR: Password does not meet the policy")
-        print("\nSpecific issues found:")
-        print("-" * 30)
-        for i, failure in enumerate(failures, 1):
-            print(f"{i}. {failure}")
+        lines.append("❌ ERROR: Password does not meet the policy")
+        lines.append("\nSpecific issues found:")
+        lines.append("-" * 30)
+        lines.extend(f"{i}. {failure}" for i, failure in enumerate(failures, 1))
     
-    print("=" * 50)
+    lines.append("=" * 50)
+    _write_lines(lines)
 
 
 def main():
@@ -240,11 +662,11 @@ def main():
     # Display welcome message to introduce the application
     display_welcome_message()
     
-    # Create an instance of the password validator
-    validator = PasswordValidator()
+    # Use the shared validator for the default password policy
+    validator = _DEFAULT
     
     # Display password requirements to the user
-    print(validator.get_password_requirements())
+    _write_lines([validator.get_password_requirements()])
     
     # Main application loop to handle multiple password attempts
     while True:
@@ -254,27 +676,29 @@ def main():
             
             # Check if user wants to exit the application
             if password.lower() in ['exit', 'quit', 'q']:
-                print("\nThank you for using Password Validator. Goodbye!")
+                _write_lines(["\nThank you for using Password Validator. Goodbye!"])
                 break
             
             # Validate the entered password
-            is_valid, failures = validator.validate_password(password)
+            is_valid, failures = validator.validate_password(password, verbose=True)
             
             # Display validation results
             display_validation_result(is_valid, failures)
             
             # Ask user if they want to try another password
-            print("\nWould you like to validate another password?")
-            continue_choice = input("Enter 'y' for yes, any other key to exit: ").strip().lower()
+            _write_lines(["\nWould you like to validate another password?"])
+            continue_choice = _prompt("Enter 'y' for yes, any other key to exit: ").lower()
             
             if continue_choice != 'y':
-                print("\nThank you for using Password Validator. Goodbye!")
+                _write_lines(["\nThank you for using Password Validator. Goodbye!"])
                 break
                 
         except Exception as e:
             # Handle any unexpected errors gracefully
-            print(f"\nAn unexpected error occurred: {e}")
-            print("Please try again or contact support if the problem persists.")
+            _write_lines([
+                f"\nAn unexpected error occurred: {e}",
+                "Please try again or contact support if the problem persists.",
+            ])
 
 
 # Application entry point
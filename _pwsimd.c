@@ -0,0 +1,166 @@
+/*
+ * Optional SIMD accelerator for the Password Validator Application.
+ *
+ * Classifies a 16-byte encoded password against the default password policy
+ * in one 128-bit register. Letters and digits are contiguous byte ranges and
+ * are found with vector compares; the scattered special characters are found
+ * with the low-nibble/high-nibble shuffle lookup used by simdjson. Builds
+ * without SSSE3 fall back to a scalar lookup table.
+ *
+ * Build in place with:
+ *     gcc -O3 -mssse3 -shared -fPIC $(python3-config --includes) \
+ *         _pwsimd.c -o _pwsimd$(python3-config --extension-suffix)
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+
+#ifdef __SSSE3__
+#include <tmmintrin.h>
+#endif
+
+/* Character class bits, matching the pure-Python class table */
+#define CLASS_UPPER   1
+#define CLASS_LOWER   2
+#define CLASS_NUMBER  4
+#define CLASS_SPECIAL 8
+
+/* Special characters accepted by the default password policy; exported as
+ * SPECIAL_DEFAULT so the Python validator can check it matches its own */
+static const char SPECIAL_DEFAULT[] = "!@#$%^&*()_+-=[]{}|;:,.<>?";
+
+#ifdef __SSSE3__
+
+/*
+ * Nibble lookup tables for the special characters, built from
+ * SPECIAL_DEFAULT at import. Every ASCII byte has a high nibble of 0-7, so
+ * each high nibble gets its own bit in hi_table, and lo_table[n] holds the
+ * bits of every high nibble that forms a special character with low nibble
+ * n. A byte is special when the bits looked up by its two nibbles
+ * intersect; bytes of 0x80 and above find no bits in hi_table.
+ */
+static uint8_t lo_table[16];
+static uint8_t hi_table[16];
+
+static void build_table(void)
+{
+    const char *c;
+    int i;
+
+    for (i = 0; i < 8; i++)
+        hi_table[i] = (uint8_t)(1 << i);
+    for (c = SPECIAL_DEFAULT; *c; c++)
+        lo_table[*c & 0x0f] |= (uint8_t)(1 << ((*c >> 4) & 0x07));
+}
+
+static int classify16(const uint8_t *p)
+{
+    const __m128i lo_lut = _mm_loadu_si128((const __m128i *)lo_table);
+    const __m128i hi_lut = _mm_loadu_si128((const __m128i *)hi_table);
+    const __m128i nibble = _mm_set1_epi8(0x0f);
+    __m128i v = _mm_loadu_si128((const __m128i *)p);
+    __m128i lo, hi, upper, lower, number, special;
+    int classes = 0;
+
+    /* Signed compares are safe: non-ASCII bytes are negative and below
+     * every range */
+    upper = _mm_and_si128(_mm_cmpgt_epi8(v, _mm_set1_epi8('A' - 1)),
+                          _mm_cmplt_epi8(v, _mm_set1_epi8('Z' + 1)));
+    lower = _mm_and_si128(_mm_cmpgt_epi8(v, _mm_set1_epi8('a' - 1)),
+                          _mm_cmplt_epi8(v, _mm_set1_epi8('z' + 1)));
+    number = _mm_and_si128(_mm_cmpgt_epi8(v, _mm_set1_epi8('0' - 1)),
+                           _mm_cmplt_epi8(v, _mm_set1_epi8('9' + 1)));
+
+    lo = _mm_shuffle_epi8(lo_lut, _mm_and_si128(v, nibble));
+    hi = _mm_shuffle_epi8(hi_lut, _mm_and_si128(_mm_srli_epi16(v, 4), nibble));
+    special = _mm_cmpeq_epi8(_mm_and_si128(lo, hi), _mm_setzero_si128());
+
+    if (_mm_movemask_epi8(upper))
+        classes |= CLASS_UPPER;
+    if (_mm_movemask_epi8(lower))
+        classes |= CLASS_LOWER;
+    if (_mm_movemask_epi8(number))
+        classes |= CLASS_NUMBER;
+    if (_mm_movemask_epi8(special) != 0xffff)
+        classes |= CLASS_SPECIAL;
+    return classes;
+}
+
+#else
+
+static unsigned char class_table[256];
+
+static void build_table(void)
+{
+    const char *c;
+    int i;
+
+    for (i = 'A'; i <= 'Z'; i++)
+        class_table[i] = CLASS_UPPER;
+    for (i = 'a'; i <= 'z'; i++)
+        class_table[i] = CLASS_LOWER;
+    for (i = '0'; i <= '9'; i++)
+        class_table[i] = CLASS_NUMBER;
+    for (c = SPECIAL_DEFAULT; *c; c++)
+        class_table[(unsigned char)*c] = CLASS_SPECIAL;
+}
+
+static int classify16(const uint8_t *p)
+{
+    int classes = 0;
+    int i;
+
+    for (i = 0; i < 16; i++)
+        classes |= class_table[p[i]];
+    return classes;
+}
+
+#endif
+
+static PyObject *
+pwsimd_classify16(PyObject *self, PyObject *arg)
+{
+    if (!PyBytes_Check(arg)) {
+        PyErr_SetString(PyExc_TypeError, "password must be bytes");
+        return NULL;
+    }
+    if (PyBytes_GET_SIZE(arg) != 16) {
+        PyErr_SetString(PyExc_ValueError, "password must be exactly 16 bytes");
+        return NULL;
+    }
+    return PyLong_FromLong(classify16((const uint8_t *)PyBytes_AS_STRING(arg)));
+}
+
+static PyMethodDef pwsimd_methods[] = {
+    {"classify16", pwsimd_classify16, METH_O,
+     "Return the character class bitmask of a 16-byte encoded password."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef pwsimd_module = {
+    PyModuleDef_HEAD_INIT,
+    "_pwsimd",
+    "SIMD character classification for 16-byte passwords.",
+    -1,
+    pwsimd_methods
+};
+
+PyMODINIT_FUNC
+PyInit__pwsimd(void)
+{
+    PyObject *module, *special;
+
+    build_table();
+    module = PyModule_Create(&pwsimd_module);
+    if (module == NULL)
+        return NULL;
+    special = PyBytes_FromString(SPECIAL_DEFAULT);
+    if (special == NULL
+        || PyModule_AddObject(module, "SPECIAL_DEFAULT", special) < 0) {
+        Py_XDECREF(special);
+        Py_DECREF(module);
+        return NULL;
+    }
+    return module;
+}
@@ -0,0 +1,71 @@
+# cython: language_level=3
+"""
+Optional Cython accelerator for the Password Validator Application.
+
+Classifies the characters of an encoded password against the default
+password policy using a 256-entry lookup table in plain C. The pure-Python
+validator is used whenever this module has not been built.
+
+Build in place with:
+    cythonize -i _pwvalidator.pyx
+"""
+
+cimport cython
+
+# Special characters accepted by the default password policy; the Python
+# validator only uses this module if they match its own default
+SPECIAL_DEFAULT = b"!@#$%^&*()_+-=[]{}|;:,.<>?"
+
+# Character class bits per byte value (1 = uppercase, 2 = lowercase,
+# 4 = number, 8 = special), filled in once when the module is loaded
+cdef unsigned char TBL[256]
+
+
+cdef void _build_table():
+    cdef int i
+    for i in range(256):
+        TBL[i] = 0
+    for i in range(ord("A"), ord("Z") + 1):
+        TBL[i] = 1
+    for i in range(ord("a"), ord("z") + 1):
+        TBL[i] = 2
+    for i in range(ord("0"), ord("9") + 1):
+        TBL[i] = 4
+    for i in SPECIAL_DEFAULT:
+        TBL[i] = 8
+
+
+_build_table()
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef int classify(bytes pw):
+    """
+    Compute the character classes present in an encoded password.
+
+    Args:
+        pw (bytes): The UTF-8 encoded password
+
+    Returns:
+        int: Bitmask of the character classes found in the password
+    """
+    cdef const unsigned char *p = pw
+    cdef Py_ssize_t i, n = len(pw)
+    cdef unsigned char acc = 0
+    for i in range(n):
+        acc |= TBL[p[i]]
+    return acc
+
+
+cpdef bint validate(bytes pw):
+    """
+    Check whether an encoded password contains every character class.
+
+    Args:
+        pw (bytes): The UTF-8 encoded password
+
+    Returns:
+        bool: True if all four character classes are present
+    """
+    return (classify(pw) & 0xF) == 0xF